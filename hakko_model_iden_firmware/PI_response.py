@@ -2,26 +2,33 @@ import serial
 import threading
 import time
 import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from datetime import datetime
+from rtd_archive import write_archive, EXTENSION
+from event_detector import EventDetector, sidecar_path, write_events
 
 # --- CONFIGURATION ---
 SERIAL_PORT = 'COM7'  # Change this!
 BAUDRATE = 115200
 DURATION_SEC = 60
 REFRESH_MS = 100
+STATION = 'bench-1'
+FIRMWARE = 'hakko_pi_step_response'
+GAINS = {'Kp': 0.029, 'Ki': 0.00245, 'Ts': 0.01}  # keep in sync with Kp/Ki/Ts in hakko_pi_step_response.ino
+SAVE_CSV = False  # the .rtda archive is the primary copy; enable for a plain-text one
 
 # --- Auto-named files ---
 timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
 CSV_FILE = f"rtd_log_{timestamp_str}.csv"
-NPY_FILE = f"rtd_log_{timestamp_str}.npy"
+ARCHIVE_FILE = f"rtd_log_{timestamp_str}{EXTENSION}"
+EVENTS_FILE = sidecar_path(ARCHIVE_FILE)
 
 # --- Globals ---
 data = []
 running = True
 start_time = time.time()
+detector = EventDetector()
 
 # --- Serial Setup ---
 ser = serial.Serial(SERIAL_PORT, BAUDRATE, timeout=1)
@@ -38,10 +45,16 @@ def read_serial():
             if not line or ',' not in line:
                 continue
             target, rtd, pwm = map(float, line.split(','))
-            timestamp = time.time() - start_time
-            data.append([timestamp, target, rtd, pwm])
         except Exception:
             continue
+        timestamp = time.time() - start_time
+        data.append([timestamp, target, rtd, pwm])
+        # Kept out of the parse guard: a detector error is logged, not taken for a bad line
+        try:
+            for event in detector.update(timestamp, target, rtd, pwm):
+                print(f"[EVENT] {event['type']} at sample {event['start']} (t={event['time']:.2f}s)")
+        except Exception as e:
+            print(f"[WARN] Event detector failed at sample {len(data) - 1}: {e!r}")
 
 # --- Plot Setup ---
 plt.style.use("seaborn-v0_8-darkgrid")
@@ -89,8 +102,25 @@ ser.close()
 
 # --- Save All Formats ---
 df = pd.DataFrame(data, columns=['Time (s)', 'Target RTD', 'Measured RTD', 'PWM (%)'])
-df.to_csv(CSV_FILE, index=False)
-np.save(NPY_FILE, df.to_numpy())
-
-
-print(f"[INFO] Saved to:\n - {CSV_FILE}\n - {NPY_FILE}\n")
+saved = []
+if SAVE_CSV:
+    df.to_csv(CSV_FILE, index=False)
+    saved.append(CSV_FILE)
+try:
+    write_archive(ARCHIVE_FILE, df.to_numpy(), {
+        'firmware': FIRMWARE,
+        'gains': GAINS,
+        'station': STATION,
+        'start_time': datetime.fromtimestamp(start_time).isoformat(),
+    })
+    saved.append(ARCHIVE_FILE)
+except Exception as e:
+    # Don't lose the run: fall back to a plain CSV copy
+    print(f"[WARN] Archive not written ({e}); saving CSV instead")
+    if not SAVE_CSV:
+        df.to_csv(CSV_FILE, index=False)
+        saved.append(CSV_FILE)
+write_events(EVENTS_FILE, detector.finish(), detector.n, saved[-1])
+saved.append(EVENTS_FILE)
+
+print("[INFO] Saved to:\n" + "".join(f" - {name}\n" for name in saved))
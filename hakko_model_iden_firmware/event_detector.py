@@ -0,0 +1,204 @@
+"""Online event detection for rtd_log_* runs.
+
+EventDetector.update() is called once per logged sample (from the serial
+thread in PI_response.py) and does O(1) work. It flags:
+
+    setpoint_step   Target RTD changed; the event spans until the next step
+    saturation      PWM pinned at 100% (or at 0% with a non-zero target)
+    open_sensor     the firmware's 9999.0 Ω open-RTD sentinel
+    oscillation     filtered error keeps swinging across a hysteresis band
+    runaway         RTD above target and still rising with the heater off
+
+Events are saved to a sidecar index (rtd_log_*.events.json) holding sample
+offsets, so analysis can read just [start, end) of a log -- e.g. with
+rtd_archive.read_archive -- instead of scanning the whole run.
+
+Run this file directly to build sidecars for the existing logs in LOG_DIR.
+"""
+import glob
+import json
+import os
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from rtd_archive import EXTENSION, read_archive
+
+# --- CONFIGURATION ---
+LOG_DIR = '.'
+SIDECAR_SUFFIX = '.events.json'
+
+STEP_MIN = 0.5               # Ω change in Target RTD that counts as a step
+OPEN_SENSOR_R = 9999.0       # firmware sentinel when vOut ~ 0
+SAT_HIGH = 99.95             # PWM (%) treated as pinned high
+SAT_LOW = 0.05               # PWM (%) treated as pinned low
+SAT_MIN_SAMPLES = 200        # 2 s at 100 Hz
+FILTER_ALPHA = 0.1           # same EMA as hakko_soldering_pi_firmware
+OSC_BAND = 2.0               # Ω hysteresis around zero error
+OSC_WINDOW = 1000            # samples (10 s at 100 Hz)
+OSC_MIN_CROSSINGS = 4        # band crossings within OSC_WINDOW
+RUNAWAY_MARGIN = 10.0        # Ω above target
+RUNAWAY_RISE = 5.0           # Ω rise while the heater is off
+RUNAWAY_SAMPLES = 200
+
+
+class EventDetector:
+    """Incremental detector; feed it samples in acquisition order."""
+
+    def __init__(self):
+        self.n = 0
+        self.events = []
+        self._open = {}       # key -> event still in progress
+        self._runs = {}       # key -> (consecutive active samples, start time)
+        self._step = None
+        self._target = None
+        self._filtered = None
+        self._osc_side = 0
+        self._crossings = deque()  # (offset, time) of recent band crossings
+        self._runaway_anchor = None
+
+    # --- Bookkeeping ---
+    def _begin(self, key, kind, start, t, **info):
+        event = {'type': kind, 'start': start, 'end': None, 'time': t, **info}
+        self.events.append(event)
+        self._open[key] = event
+        return event
+
+    def _end(self, key, end):
+        event = self._open.pop(key, None)
+        if event is not None:
+            event['end'] = end
+
+    def _track(self, key, kind, active, i, t, min_samples=1, **info):
+        """Open an event once `active` has held for min_samples, close it when it drops."""
+        if not active:
+            self._runs.pop(key, None)
+            self._end(key, i)
+            return None
+        run, t_start = self._runs.get(key, (0, t))
+        run += 1
+        self._runs[key] = (run, t_start)
+        if run == min_samples and key not in self._open:
+            return self._begin(key, kind, i - run + 1, t_start, **info)
+        return None
+
+    # --- Per-sample update ---
+    def update(self, t, target, rtd, pwm):
+        """Process one sample; returns the events that started on it."""
+        i = self.n
+        self.n += 1
+        new = []
+
+        if self._target is None or abs(target - self._target) >= STEP_MIN:
+            if self._target is not None:
+                self._end('step', i)
+                new.append(self._begin('step', 'setpoint_step', i, t,
+                                       previous=self._target, target=target))
+                # Errors straight after a step say nothing about oscillation
+                self._crossings.clear()
+                self._osc_side = 0
+            self._target = target
+
+        open_sensor = rtd >= OPEN_SENSOR_R
+        new.append(self._track('open_sensor', 'open_sensor', open_sensor, i, t))
+        new.append(self._track('sat_high', 'saturation', pwm >= SAT_HIGH, i, t,
+                               SAT_MIN_SAMPLES, level='high'))
+        new.append(self._track('sat_low', 'saturation', target > 0 and pwm <= SAT_LOW, i, t,
+                               SAT_MIN_SAMPLES, level='low'))
+        if open_sensor:
+            # Keep the sentinel out of the filters; other detectors hold their state
+            return [e for e in new if e]
+
+        prev = self._filtered
+        self._filtered = rtd if prev is None else prev + FILTER_ALPHA * (rtd - prev)
+
+        new.append(self._update_oscillation(i, t, target))
+        new.append(self._update_runaway(i, t, target, pwm))
+        return [e for e in new if e]
+
+    def _update_oscillation(self, i, t, target):
+        error = target - self._filtered
+        side = 1 if error > OSC_BAND else -1 if error < -OSC_BAND else 0
+        if side and side != self._osc_side:
+            if self._osc_side:
+                self._crossings.append((i, t))
+            self._osc_side = side
+        while self._crossings and self._crossings[0][0] <= i - OSC_WINDOW:
+            self._crossings.popleft()
+
+        active = target > 0 and len(self._crossings) >= OSC_MIN_CROSSINGS
+        if active and 'oscillation' not in self._open:
+            # Report from the first crossing in the window, not the detection point
+            start, t_start = self._crossings[0]
+            return self._begin('oscillation', 'oscillation', start, t_start)
+        if not active:
+            self._end('oscillation', i)
+        return None
+
+    def _update_runaway(self, i, t, target, pwm):
+        condition = pwm <= SAT_LOW and self._filtered > target + RUNAWAY_MARGIN
+        if not condition:
+            self._runaway_anchor = None
+            self._end('runaway', i)
+            return None
+        if self._runaway_anchor is None:
+            self._runaway_anchor = (i, t, self._filtered)
+        start, t_start, r_start = self._runaway_anchor
+        if ('runaway' not in self._open and i - start + 1 >= RUNAWAY_SAMPLES
+                and self._filtered - r_start >= RUNAWAY_RISE):
+            return self._begin('runaway', 'runaway', start, t_start)
+        return None
+
+    def finish(self):
+        """Close events still open at the end of the log."""
+        for key in list(self._open):
+            self._end(key, self.n)
+        return self.events
+
+
+# --- Sidecar index ---
+def sidecar_path(log_path):
+    return os.path.splitext(log_path)[0] + SIDECAR_SUFFIX
+
+
+def write_events(path, events, n_samples, source=None):
+    with open(path, 'w') as f:
+        json.dump({'source': source, 'n_samples': n_samples, 'events': events}, f, indent=1)
+
+
+def read_events(path, kind=None):
+    """Return the events in a sidecar, optionally only those of one type."""
+    with open(path) as f:
+        events = json.load(f)['events']
+    return [e for e in events if kind is None or e['type'] == kind]
+
+
+def detect_log(path):
+    """Run the detector over a saved .csv/.npy/.rtda log and write its sidecar."""
+    if path.endswith(EXTENSION):
+        data, _ = read_archive(path)
+    elif path.endswith('.csv'):
+        data = pd.read_csv(path).to_numpy(dtype=np.float64)
+    else:
+        data = np.load(path)
+
+    detector = EventDetector()
+    for t, target, rtd, pwm in data.tolist():
+        detector.update(t, target, rtd, pwm)
+    events = detector.finish()
+
+    dst = sidecar_path(path)
+    write_events(dst, events, detector.n, os.path.basename(path))
+    return dst, events
+
+
+if __name__ == '__main__':
+    stems = sorted({os.path.splitext(p)[0] for ext in (EXTENSION, '.csv', '.npy')
+                    for p in glob.glob(os.path.join(LOG_DIR, 'rtd_log_*' + ext))})
+    for stem in stems:
+        src = next(stem + ext for ext in (EXTENSION, '.csv', '.npy') if os.path.exists(stem + ext))
+        dst, events = detect_log(src)
+        print(f"[INFO] {os.path.basename(src)} -> {os.path.basename(dst)}")
+        for e in events:
+            print(f"   {e['type']:<14} samples {e['start']:>6}-{e['end']:<6} t={e['time']:.2f}s")
@@ -1,11 +1,12 @@
 import pandas as pd
 import matplotlib.pyplot as plt
+from rtd_archive import EXTENSION, read_dataframe
 
 # --- CONFIGURATION ---
-CSV_FILE = 'rtd_log_20250724_174622.csv'  # Change to your actual file name
+LOG_FILE = 'rtd_log_20250724_174622.csv'  # .csv or .rtda; change to your actual file name
 
 # --- Load Data ---
-df = pd.read_csv(CSV_FILE)
+df = read_dataframe(LOG_FILE) if LOG_FILE.endswith(EXTENSION) else pd.read_csv(LOG_FILE)
 
 # --- Plot ---
 plt.figure(figsize=(10, 6))
@@ -15,7 +16,7 @@ plt.plot(df['Time (s)'], df['PWM (%)'], label='PWM (%)', alpha=0.7)
 
 plt.xlabel('Time (s)')
 plt.ylabel('Value')
-plt.title('RTD Closed-Loop Control (from CSV)')
+plt.title('RTD Closed-Loop Control (from log)')
 plt.legend()
 plt.grid(True)
 plt.tight_layout()
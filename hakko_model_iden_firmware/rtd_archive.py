@@ -0,0 +1,221 @@
+"""Compact columnar archive for rtd_log_* runs (.rtda).
+
+Layout:
+    preamble   b'RTDA', version (u8), header length (u32, little-endian)
+    header     UTF-8 JSON: metadata, channel specs and the chunk index
+    data       zlib-compressed chunks, one blob per (chunk, channel)
+
+Each channel is stored as fixed-point integers (value * 10**decimals),
+delta-encoded inside its chunk and packed into the narrowest integer type
+that holds the deltas. Chunks restart the delta chain, so any sample range
+can be decoded by reading only the chunks that cover it.
+
+Run this file directly to convert the existing CSV/NPY logs in LOG_DIR.
+"""
+import glob
+import json
+import os
+import struct
+import zlib
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# --- CONFIGURATION ---
+LOG_DIR = '.'
+# Stamped into logs converted by convert_log(); new runs carry PI_response.py's config.
+LEGACY_METADATA = {
+    'firmware': 'hakko_pi_step_response',
+    'gains': {'Kp': 0.029, 'Ki': 0.00245, 'Ts': 0.01},  # as flashed for the 20250724 runs
+    'station': 'bench-1',
+}
+
+# --- Format constants ---
+MAGIC = b'RTDA'
+VERSION = 1
+EXTENSION = '.rtda'
+CHUNK_SIZE = 4096
+COMPRESS_LEVEL = 1  # zlib: fastest setting, deltas already compress well
+
+# (name, decimals) -- matches the firmware's Serial.print precision.
+# Time is host-side time.time(), kept to the microsecond.
+CHANNELS = [
+    ('Time (s)', 6),
+    ('Target RTD', 2),
+    ('Measured RTD', 2),
+    ('PWM (%)', 1),
+]
+
+_PREAMBLE = struct.Struct('<4sBI')
+_INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+# --- Encoding ---
+def _encode_column(values, decimals):
+    if not np.all(np.isfinite(values)):
+        raise ValueError("Cannot archive NaN/inf samples")
+    ints = np.rint(values * 10.0 ** decimals).astype(np.int64)
+    deltas = np.diff(ints, prepend=0)
+    lo, hi = deltas.min(), deltas.max()
+    for int_type in _INT_TYPES:
+        info = np.iinfo(int_type)
+        if info.min <= lo and hi <= info.max:
+            break
+    packed = deltas.astype(int_type)
+    return np.dtype(int_type).str, zlib.compress(packed.tobytes(), COMPRESS_LEVEL)
+
+
+def _decode_column(blob, dtype, decimals, out):
+    # frombuffer views the decompressed bytes; cumsum writes straight into out.
+    deltas = np.frombuffer(zlib.decompress(blob), dtype=dtype)
+    np.cumsum(deltas, dtype=np.float64, out=out)
+    out /= 10.0 ** decimals
+
+
+# --- Writing ---
+def write_archive(path, data, metadata=None, channels=CHANNELS, chunk_size=CHUNK_SIZE):
+    """Write an (n, len(channels)) array to path; returns the header dict."""
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim != 2 or data.shape[1] != len(channels):
+        raise ValueError(f"Expected data of shape (n, {len(channels)}), got {data.shape}")
+
+    blobs = []
+    chunks = []
+    offset = 0
+    for start in range(0, len(data), chunk_size):
+        block = data[start:start + chunk_size]
+        columns = []
+        for j, (_, decimals) in enumerate(channels):
+            dtype, blob = _encode_column(block[:, j], decimals)
+            columns.append([offset, len(blob), dtype])
+            blobs.append(blob)
+            offset += len(blob)
+        chunks.append({'start': start, 'n': len(block), 'columns': columns})
+
+    header = {
+        'metadata': metadata or {},
+        'channels': [{'name': name, 'decimals': decimals} for name, decimals in channels],
+        'n_samples': len(data),
+        'chunk_size': chunk_size,
+        'chunks': chunks,
+    }
+    header_bytes = json.dumps(header).encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for blob in blobs:
+            f.write(blob)
+    return header
+
+
+# --- Reading ---
+def _read_header(f):
+    magic, version, header_len = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+    if magic != MAGIC:
+        raise ValueError("Not an RTD archive")
+    if version != VERSION:
+        raise ValueError(f"Unsupported archive version {version}")
+    header = json.loads(f.read(header_len).decode('utf-8'))
+    header['data_offset'] = _PREAMBLE.size + header_len
+    return header
+
+
+def read_header(path):
+    """Return the archive header (metadata, channels, chunk index)."""
+    with open(path, 'rb') as f:
+        return _read_header(f)
+
+
+def read_archive(path, start=0, stop=None, channels=None):
+    """Decode samples [start, stop) of the selected channels.
+
+    Returns (data, header) where data is a float64 (n, n_channels) array.
+    Only the chunks overlapping the requested range are read from disk.
+    """
+    with open(path, 'rb') as f:
+        header = _read_header(f)
+        names = [c['name'] for c in header['channels']]
+        if channels is None:
+            channels = names
+        col_idx = [names.index(name) for name in channels]
+
+        n_samples = header['n_samples']
+        stop = n_samples if stop is None else min(stop, n_samples)
+        start = max(0, start)
+        if start >= stop:
+            return np.empty((0, len(col_idx))), header
+
+        chunk_size = header['chunk_size']
+        first, last = start // chunk_size, (stop - 1) // chunk_size
+        span_start = header['chunks'][first]['start']
+        span_stop = header['chunks'][last]['start'] + header['chunks'][last]['n']
+
+        # Fortran order keeps every column contiguous, so chunks decode in place.
+        out = np.empty((span_stop - span_start, len(col_idx)), order='F')
+        for chunk in header['chunks'][first:last + 1]:
+            row = chunk['start'] - span_start
+            for k, j in enumerate(col_idx):
+                offset, length, dtype = chunk['columns'][j]
+                f.seek(header['data_offset'] + offset)
+                _decode_column(f.read(length), dtype, header['channels'][j]['decimals'],
+                               out[row:row + chunk['n'], k])
+
+    return out[start - span_start:stop - span_start], header
+
+
+def read_dataframe(path, start=0, stop=None, channels=None):
+    """Same as read_archive, wrapped in a DataFrame with the CSV column names."""
+    data, header = read_archive(path, start, stop, channels)
+    names = channels or [c['name'] for c in header['channels']]
+    # Index rows by their sample offset in the log, not from 0
+    start = max(0, start)
+    return pd.DataFrame(data, columns=names, index=pd.RangeIndex(start, start + len(data)),
+                        copy=False)
+
+
+# --- Conversion of legacy logs ---
+def _start_time_from_name(stem):
+    try:
+        return datetime.strptime(stem[len('rtd_log_'):], '%Y%m%d_%H%M%S').isoformat()
+    except ValueError:
+        return None
+
+
+def convert_log(src, metadata=None):
+    """Convert one rtd_log_*.csv or .npy file to .rtda next to it."""
+    stem, ext = os.path.splitext(src)
+    if ext == '.csv':
+        df = pd.read_csv(src)
+        expected = [name for name, _ in CHANNELS]
+        if list(df.columns) != expected:
+            raise ValueError(f"{src}: unexpected columns {list(df.columns)}")
+        data = df.to_numpy(dtype=np.float64)
+    else:
+        data = np.load(src)
+
+    meta = {
+        **LEGACY_METADATA,
+        'start_time': _start_time_from_name(os.path.basename(stem)),
+        'source': os.path.basename(src),
+    }
+    meta.update(metadata or {})
+
+    dst = stem + EXTENSION
+    write_archive(dst, data, meta)
+    return dst
+
+
+if __name__ == '__main__':
+    stems = sorted({os.path.splitext(p)[0]
+                    for p in glob.glob(os.path.join(LOG_DIR, 'rtd_log_*.csv'))
+                    + glob.glob(os.path.join(LOG_DIR, 'rtd_log_*.npy'))})
+    for stem in stems:
+        # The CSV holds the values exactly as printed, so prefer it over the .npy copy
+        src = stem + '.csv' if os.path.exists(stem + '.csv') else stem + '.npy'
+        dst = convert_log(src)
+        old = sum(os.path.getsize(stem + e) for e in ('.csv', '.npy') if os.path.exists(stem + e))
+        new = os.path.getsize(dst)
+        print(f"[INFO] {os.path.basename(src)} -> {os.path.basename(dst)} "
+              f"({old / 1024:.1f} KiB -> {new / 1024:.1f} KiB, {old / new:.1f}x)")
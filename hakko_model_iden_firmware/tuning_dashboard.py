@@ -0,0 +1,550 @@
+"""Interactive PID tuning dashboard for the RTD loop.
+
+Sliders set Kp, Ki, Kd, the measurement EMA alpha and the first-order
+plant k/(tau s + 1). The loop is discretised at the firmware period TS,
+using the firmware's integrator and anti-windup. The EMA and D term are
+additions for exploring; alpha = 1 and Kd = 0 give the flashed PI loop:
+
+    f[n] = (1 - alpha) f[n-1] + alpha y[n]                 (measurement EMA)
+    e[n] = r - f[n]
+    I[n] = I[n-1] + Ki (e[n] + e[n-1]) / 2 TS             (trapezoid rule)
+    u[n] = Kp e[n] + I[n] - Kd (f[n] - f[n-1]) / TS       (D on measurement)
+
+Without PWM limits the loop is linear and the response is a few matrix
+products (free_response). With 'PWM limits' ticked the firmware's clamps
+split the response into stretches, each linear and jumped the same way;
+where the clamps chatter it falls back to stepping the firmware's loop.
+Slider values snap to a grid so revisited states come from the cache.
+While dragging only the plots and the moved slider are blitted; the
+metrics text is slow to render and is refreshed when the mouse is released.
+
+Run with --check to compare the fast path against the direct loop and to
+time slider frames off-screen.
+"""
+import math
+import sys
+import time
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.patches import Polygon
+from matplotlib.transforms import Bbox
+from matplotlib.widgets import Slider, CheckButtons
+
+from rtd_archive import EXTENSION, read_dataframe
+
+# --- CONFIGURATION ---
+RUN_FILE = 'rtd_log_20250724_174622.csv'  # .csv or .rtda to overlay, None to disable
+TS = 0.01          # controller period (s), 100 Hz
+T_END = 60.0       # simulated horizon after the setpoint step (s)
+R_AMBIENT = 55.0   # used when no run is loaded (Ω)
+R_TARGET = 150.0
+TOL = 0.02         # 2% settling band
+POLE_XLIM = (-1.0, 0.2)
+POLE_YLIM = (-0.6, 0.6)
+U_YLIM = (-50, 300)  # control terms (%)
+JUMP_WINDOW = 64     # first window (samples) when jumping through one clamp mode
+CHATTER_RUN = 64     # shorter stretches are cheaper to step: fall back to the direct loop...
+LOOP_BLOCK = 200     # ...for this many samples, doubling while chatter persists
+DIVERGED = 1e6       # |value| treated as a diverged linear loop
+PLOT_EVERY = 10      # one plotted point per N simulated samples, about a pixel column each
+CACHE_SIZE = 32      # simulate() results kept, ~240 KB each
+
+CHECK = sys.argv[1:] == ['--check']
+if CHECK:
+    plt.switch_backend('agg')  # frames are timed off-screen
+
+# (name, label, min, max, initial, step) -- plant defaults fitted by eye to the 20250724 runs
+SLIDERS = [
+    ('Kp', 'Kp', 0.0, 0.2, 0.029, 0.0005),
+    ('Ki', 'Ki', 0.0, 0.02, 0.00245, 0.00005),
+    ('Kd', 'Kd', 0.0, 0.5, 0.0, 0.005),
+    ('alpha', 'Filter α', 0.01, 1.0, 1.0, 0.01),
+    ('k', 'Plant k (Ω)', 50.0, 1000.0, 400.0, 5.0),
+    ('tau', 'Plant τ (s)', 5.0, 120.0, 40.0, 0.5),
+]
+
+t_sim = np.arange(0, T_END, TS)
+t_plot = t_sim[::PLOT_EVERY]
+
+
+# --- Recorded run ---
+def load_run(path):
+    df = read_dataframe(path) if path.endswith(EXTENSION) else pd.read_csv(path)
+    t = df['Time (s)'].to_numpy()
+    target = df['Target RTD'].to_numpy()
+    measured = df['Measured RTD'].to_numpy()
+    pwm = df['PWM (%)'].to_numpy()
+
+    changes = np.flatnonzero(np.diff(target) != 0) + 1
+    if changes.size == 0:
+        raise ValueError(f"{path}: no setpoint step found")
+    i0 = changes[0]
+    r_ambient = measured[:max(i0, 1)].mean()
+    return t[i0:] - t[i0], measured[i0:], pwm[i0:], r_ambient, target[i0]
+
+
+# --- Closed-loop model (deviation from ambient, state x = [y, f_prev, I_prev, e_prev, 1]) ---
+ONE = np.array([0.0, 0.0, 0.0, 0.0, 1.0])
+F_PREV = np.array([0.0, 1.0, 0.0, 0.0, 0.0])
+I_PREV = np.array([0.0, 0.0, 1.0, 0.0, 0.0])
+E_PREV = np.array([0.0, 0.0, 0.0, 1.0, 0.0])
+
+# Bits of a clamp mode, one per branch of the firmware's anti-windup
+PD_HIGH, I_HIGH, PD_LOW, I_LOW, U_HIGH, U_LOW = 1, 2, 4, 8, 16, 32
+
+
+def controller_rows(Kp, Ki, Kd, alpha, step):
+    """Rows giving f, e, P, D and the unclamped I term as linear functions of x."""
+    F = alpha * np.array([1.0, 0.0, 0.0, 0.0, 0.0]) + (1 - alpha) * F_PREV
+    E = step * ONE - F
+    P = Kp * E
+    D = -Kd / TS * (F - F_PREV)
+    I = I_PREV + Ki * (E + E_PREV) / 2 * TS  # trapezoid rule, as in the firmware
+    return F, E, P, D, I
+
+
+def clamp_modes(u_pd, i_raw):
+    """Mode bits for each sample, following the firmware's clamps in order.
+
+    The last two bits are constrain() on the duty cycle: the firmware can
+    leave u_P + u_I above 1 when u_P was clamped up from below zero.
+    """
+    hi_pd = u_pd > 1.0
+    p1 = np.where(hi_pd, 1.0, u_pd)
+    hi_i = p1 + i_raw > 1.0
+    i1 = np.where(hi_i, 1.0 - p1, i_raw)
+    lo_pd = p1 < 0.0
+    p2 = np.where(lo_pd, 0.0, p1)
+    lo_i = p2 + i1 < 0.0
+    v = p2 + np.where(lo_i, -p2, i1)
+    return (hi_pd * PD_HIGH + hi_i * I_HIGH + lo_pd * PD_LOW + lo_i * I_LOW
+            + (v > 1.0) * U_HIGH + (v < 0.0) * U_LOW)
+
+
+def mode_system(a, b, F, E, P, D, I, mode):
+    """State matrix and I/u rows while the clamps are held in one mode."""
+    p = ONE if mode & PD_HIGH else P + D
+    i = ONE - p if mode & I_HIGH else I
+    p = 0.0 * ONE if mode & PD_LOW else p
+    i = -p if mode & I_LOW else i
+    u = ONE if mode & U_HIGH else 0.0 * ONE if mode & U_LOW else p + i
+    A = np.vstack([np.array([a, 0.0, 0.0, 0.0, 0.0]) + b * u, F, i, E, ONE])
+    return A, i, u
+
+
+def free_response(A, x0, n):
+    """States x[0..n) of x[k+1] = A x[k], where the last state is the constant 1.
+
+    Built by doubling, x[m:2m] = A^m x[0:m], so n samples cost about log2(n)
+    small matrix products instead of a Python loop over time.
+    """
+    X = np.empty((len(x0), n))
+    X[:, 0] = x0
+    Am = A
+    m = 1
+    while m < n:
+        w = min(m, n - m)
+        X[:, m:m + w] = Am @ X[:, :w]
+        Am = Am @ Am
+        m *= 2
+    return X
+
+
+def firmware_loop(Kp, Ki, Kd, alpha, a, b, step, state, n, saturate=True):
+    """Step the control law sample by sample, written as the firmware does it.
+
+    Returns (rows y/P/I/D/u, state after n samples). Used where the clamps
+    chatter too much to jump ahead, and as the reference for --check.
+    """
+    y, f, integral, e_prev = state
+    ys, ps, is_, ds, us = [0.0] * n, [0.0] * n, [0.0] * n, [0.0] * n, [0.0] * n
+    ki_ts2, kd_ts = Ki * TS / 2, Kd / TS
+    for m in range(n):
+        f_new = f + alpha * (y - f)
+        error = step - f_new
+        u_p = Kp * error
+        u_d = kd_ts * (f - f_new)
+        integral += ki_ts2 * (error + e_prev)
+        e_prev = error
+        u = u_p + u_d + integral
+        if saturate:
+            u_pd = u_p + u_d
+            if u_pd > 1.0:
+                u_pd = 1.0
+            if u_pd + integral > 1.0:
+                integral = 1.0 - u_pd
+            if u_pd < 0.0:
+                u_pd = 0.0
+            if u_pd + integral < 0.0:
+                integral = -u_pd
+            u = u_pd + integral
+            if u > 1.0:  # constrain() on the duty cycle
+                u = 1.0
+            elif u < 0.0:
+                u = 0.0
+        ys[m], ps[m], is_[m], ds[m], us[m] = y, u_p, integral, u_d, u
+        y = a * y + b * u
+        f = f_new
+    return np.array([ys, ps, is_, ds, us]), (y, f, integral, e_prev)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+@np.errstate(over='ignore', invalid='ignore')  # diverging modes overflow; see DIVERGED
+def simulate(Kp, Ki, Kd, alpha, k, tau, step, saturate):
+    """Return (rows y/P/I/D/u over t_sim, closed-loop z-plane poles).
+
+    With saturate, each stretch in one clamp mode is jumped with
+    free_response, in windows that double until the mode changes. Where
+    stretches stay shorter than CHATTER_RUN the clamps are chattering, and
+    firmware_loop steps a block of samples directly instead, so the worst
+    case is one direct loop over the horizon.
+    """
+    a = math.exp(-TS / tau)
+    b = k * (1 - a)
+    F, E, P, D, I = controller_rows(Kp, Ki, Kd, alpha, step)
+    A_linear, _, _ = mode_system(a, b, F, E, P, D, I, 0)
+    poles = np.linalg.eigvals(A_linear[:4, :4])
+    n = len(t_sim)
+
+    if not saturate:
+        X = free_response(A_linear, ONE, n)
+        out = np.array([X[0], P @ X, I @ X, D @ X, (P + D + I) @ X])
+        out[~(np.abs(out) < DIVERGED)] = np.nan
+        return out, poles
+
+    out = np.empty((5, n))
+    x = ONE.copy()
+    i = 0
+    block = LOOP_BLOCK
+    while i < n:
+        mode = int(clamp_modes((P + D) @ x, I @ x))
+        A, Ic, U = mode_system(a, b, F, E, P, D, I, mode)
+        w = min(JUMP_WINDOW, n - i)
+        while True:
+            seg = free_response(A, x, w)
+            switch = np.flatnonzero(clamp_modes((P + D) @ seg, I @ seg) != mode)
+            if switch.size or w == n - i:
+                j = switch[0] if switch.size else w
+                break
+            w = min(2 * w, n - i)
+        out[:, i:i + j] = [seg[0, :j], P @ seg[:, :j], Ic @ seg[:, :j], D @ seg[:, :j], U @ seg[:, :j]]
+        i += j
+        if i == n:
+            break
+        x = seg[:, j]
+
+        if j < CHATTER_RUN:
+            m = min(block, n - i)
+            rows, state = firmware_loop(Kp, Ki, Kd, alpha, a, b, step, x[:4], m)
+            out[:, i:i + m] = rows
+            i += m
+            x = np.array([*state, 1.0])
+            block *= 2  # sustained chatter ends up as one long direct loop
+        else:
+            block = LOOP_BLOCK
+    return out, poles
+
+
+def check_fast_path(n_states=60, seed=0, tol=1e-6):
+    """Compare simulate() with firmware_loop over random slider states.
+
+    Both the clamped path and, where the linear loop is stable, the
+    unclamped one are checked; only the clamped path is timed.
+
+    Limit cycles with heavy D and little filtering are chaotic: nudging the
+    direct loop itself by 1e-12 Ω moves it by more than tol. Such states are
+    listed but kept out of the pass/fail count.
+    """
+    rng = np.random.default_rng(seed)
+    step = R_TARGET - R_AMBIENT
+    failed, chaotic, times = 0, 0, []
+    for _ in range(n_states):
+        params = tuple(float(rng.uniform(vmin, vmax)) for _, _, vmin, vmax, _, _ in SLIDERS)
+        Kp, Ki, Kd, alpha, k, tau = params
+        a = math.exp(-TS / tau)
+        ref, _ = firmware_loop(Kp, Ki, Kd, alpha, a, k * (1 - a), step, (0.0, 0.0, 0.0, 0.0), len(t_sim))
+        nudged, _ = firmware_loop(Kp, Ki, Kd, alpha, a, k * (1 - a), step, (1e-12, 0.0, 0.0, 0.0), len(t_sim))
+        t0 = time.perf_counter()
+        out, _ = simulate.__wrapped__(*params, step, True)
+        times.append(time.perf_counter() - t0)
+
+        err = np.abs(out - ref).max()
+        lin, poles = simulate.__wrapped__(*params, step, False)
+        if np.abs(poles).max() < 1:
+            lin_ref, _ = firmware_loop(Kp, Ki, Kd, alpha, a, k * (1 - a), step, (0.0, 0.0, 0.0, 0.0),
+                                       len(t_sim), saturate=False)
+            err = max(err, np.abs(lin - lin_ref).max())
+        spread = np.abs(nudged - ref).max()
+        status = 'ok'
+        if spread > tol:
+            chaotic += 1
+            status = 'chaotic'
+        elif err > tol:
+            failed += 1
+            status = 'MISMATCH'
+        print(f"{' '.join(f'{v:9.4g}' for v in params)}   |d| {err:.1e}  "
+              f"nudge {spread:.1e}  {times[-1] * 1e3:6.2f} ms  {status}")
+    print(f"[INFO] {failed} mismatches, {chaotic} chaotic of {n_states}; "
+          f"median {np.median(times) * 1e3:.2f} ms, slowest {max(times) * 1e3:.2f} ms")
+
+
+def z_to_s(z):
+    z = z[np.abs(z) > 1e-12]  # pure delays (alpha = 1) sit at z = 0, s = -inf
+    return np.log(z.astype(complex)) / TS
+
+
+def step_metrics(t, y, step):
+    yn = y / step
+    os_percent = max(0.0, (yn.max() - 1.0) * 100.0)
+
+    # Last time the response enters the band and stays within afterwards
+    last_out = np.flatnonzero(np.abs(yn - 1.0) > TOL)
+    if last_out.size == 0:
+        ts = t[0]
+    else:
+        ts = t[last_out[-1] + 1] if last_out[-1] + 1 < len(t) else np.nan
+
+    i10, i90 = np.argmax(yn >= 0.1), np.argmax(yn >= 0.9)
+    tr = t[i90] - t[i10] if yn[i90] >= 0.9 else np.nan
+    return os_percent, ts, tr
+
+
+def envelope(t, v):
+    """Polygon around the min/max of v over each PLOT_EVERY samples, drawn against t.
+
+    Chattering terms swing full scale between samples; drawn as a line they
+    fill the axes with crossing segments, which Agg takes a whole frame to
+    rasterise. The band shows the same range at a fraction of the cost.
+    """
+    bins = v.reshape(-1, PLOT_EVERY)
+    lo, hi = bins.min(axis=1), bins.max(axis=1)
+    return np.column_stack([np.r_[t, t[::-1]], np.r_[hi, lo[::-1]]])
+
+
+def fmt(x, unit=''):
+    return f"{x:.2f}{unit}" if np.isfinite(x) else "—"
+
+
+# --- Reference run ---
+run = load_run(RUN_FILE) if RUN_FILE else None
+if run is not None:
+    t_run, y_run, pwm_run, r_ambient, r_target = run
+    run_metrics = step_metrics(t_run, y_run - r_ambient, r_target - r_ambient)
+else:
+    r_ambient, r_target = R_AMBIENT, R_TARGET
+step = r_target - r_ambient
+
+# --- Figure ---
+fig = plt.figure(figsize=(13, 8))
+gs = fig.add_gridspec(2, 2, width_ratios=[1, 1.6], left=0.06, right=0.97,
+                      top=0.95, bottom=0.4, hspace=0.3, wspace=0.2)
+ax_pole = fig.add_subplot(gs[:, 0])
+ax_y = fig.add_subplot(gs[0, 1])
+ax_u = fig.add_subplot(gs[1, 1], sharex=ax_y)
+
+ax_pole.axhline(0, color='gray', lw=0.5)
+ax_pole.axvline(0, color='gray', lw=0.5)
+ax_pole.set_xlim(POLE_XLIM)
+ax_pole.set_ylim(POLE_YLIM)
+ax_pole.set_xlabel('Real Axis (rad/s)')
+ax_pole.set_ylabel('Imaginary Axis (rad/s)')
+ax_pole.set_title('Closed-Loop Poles')
+for sign in (1, -1):  # ζ = 0.707 guide
+    ax_pole.plot([0, POLE_XLIM[0]], [0, -sign * POLE_XLIM[0]], 'k:', lw=0.8)
+pole_pts, = ax_pole.plot([], [], 'rx', ms=9, mew=2)
+
+ax_y.set_xlim(0, T_END)
+ax_y.set_ylim(0, 1.3 * r_target)
+ax_y.set_ylabel('RTD (Ω)')
+ax_y.set_title('Step Response')
+ax_y.axhline(r_target, color='black', linestyle='--', linewidth=1)
+for band in (1 - TOL, 1 + TOL):
+    ax_y.axhline(r_ambient + band * step, color='black', linestyle=':', linewidth=0.8)
+line_y, = ax_y.plot([], [], 'b-', lw=2, label='Model y(t)')
+
+ax_u.set_ylim(U_YLIM)
+ax_u.set_xlabel('Time (s)')
+ax_u.set_ylabel('Control (%)')
+ax_u.axhline(0, color='black', linestyle='--', linewidth=1)
+ax_u.axhline(100, color='black', linestyle='--', linewidth=1)
+bands = []
+for color, label in (('r', 'P term'), ('g', 'I term'), ('m', 'D term'), ('k', 'Control u(t)')):
+    bands.append(ax_u.add_patch(
+        Polygon(np.empty((0, 2)), facecolor=color, edgecolor=color, alpha=0.3, lw=1.2, label=label)))
+
+run_lines = []
+if run is not None:
+    run_lines += ax_y.plot(t_run, y_run, color='tab:orange', alpha=0.7, label=f'Run {RUN_FILE}')
+    run_lines += ax_u.plot(t_run, pwm_run, color='tab:orange', alpha=0.5, label='Run PWM')
+ax_y.legend(loc='lower right')
+ax_u.legend(loc='upper right', ncol=3)
+
+ax_info = fig.add_axes([0.68, 0.02, 0.29, 0.17])
+ax_info.axis('off')
+text_info = ax_info.text(0, 1, '', va='top', transform=ax_info.transAxes)
+if run is not None:
+    r_os, r_ts, r_tr = run_metrics
+    ax_info.text(0, 0.5, f"Run   %OS {fmt(r_os, '%')}  t_s {fmt(r_ts, ' s')}  t_r {fmt(r_tr, ' s')}",
+                 va='top', transform=ax_info.transAxes)
+
+ax_check = fig.add_axes([0.68, 0.21, 0.15, 0.08])
+if run is not None:
+    # The run sits at 100% PWM for seconds, so compare it against the clamped model
+    check = CheckButtons(ax_check, ['PWM limits', 'Show run'], [True, True])
+else:
+    check = CheckButtons(ax_check, ['PWM limits'], [False])
+
+sliders = {}
+for i, (name, label, vmin, vmax, valinit, valstep) in enumerate(SLIDERS):
+    s_ax = fig.add_axes([0.12, 0.27 - i * 0.045, 0.42, 0.03])
+    s = Slider(s_ax, label, vmin, vmax, valinit=valinit, valstep=valstep, valfmt='%.4g')
+    s.drawon = False  # redrawn by blitting below
+    s.valtext.set_animated(True)
+    s.label.set_animated(True)  # static, but left out of the axes so blits skip its glyphs
+    sliders[name] = s
+
+animated = {
+    ax_pole: [pole_pts],
+    ax_y: [line_y],
+    ax_u: bands,
+}
+for artists in animated.values():
+    for a in artists:
+        a.set_animated(True)
+text_info.set_animated(True)
+
+backgrounds = {}
+info = ''  # metrics for the current state, shown by show_info()
+
+
+# --- Update ---
+def recompute():
+    global info
+    params = tuple(s.val for s in sliders.values())
+    saturate = check.get_status()[0]
+    out, z = simulate(*params, step, saturate)
+    y, u = out[0], out[4]
+
+    s = z_to_s(z)
+    pole_pts.set_data(s.real, s.imag)
+    line_y.set_data(t_plot, r_ambient + y[::PLOT_EVERY])
+    for band, term in zip(bands, out[1:]):
+        band.set_xy(envelope(t_plot, 100 * term))
+
+    dominant = s[np.argmax(s.real)]
+    wn = abs(dominant)
+    zeta = -dominant.real / wn if wn > 0 else np.nan
+    if not np.all(np.isfinite(y)):
+        info = f"Model unstable (linear loop diverges)\nζ {fmt(zeta)}  ω_n {fmt(wn)}"
+        return
+    os_percent, ts, tr = step_metrics(t_sim, y, step)
+    info = (f"Model %OS {fmt(os_percent, '%')}  t_s {fmt(ts, ' s')}  t_r {fmt(tr, ' s')}\n"
+            f"peak u {fmt(100 * u.max(), '%')}  ζ {fmt(zeta)}  ω_n {fmt(wn)}")
+
+
+def slider_strip(s):
+    # The value text sits right of the slider axes; the static label is left out
+    return Bbox.from_extents(s.ax.bbox.x0 - 6, s.ax.bbox.y0 - 5,
+                             ax_info.bbox.x0 - 5, s.ax.bbox.y1 + 5)
+
+
+def draw_slider(s):
+    fig.draw_artist(s.ax)
+    fig.draw_artist(s.valtext)
+
+
+def on_draw(event):
+    canvas = fig.canvas
+    for ax in (*animated, ax_info):
+        backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+    for s in sliders.values():
+        backgrounds[s] = canvas.copy_from_bbox(slider_strip(s))
+    for ax, artists in animated.items():
+        for a in artists:
+            ax.draw_artist(a)
+    for s in sliders.values():
+        fig.draw_artist(s.label)
+        fig.draw_artist(s.valtext)
+    text_info.set_text(info)
+    ax_info.draw_artist(text_info)
+
+
+def blit_plots():
+    canvas = fig.canvas
+    for ax, artists in animated.items():
+        canvas.restore_region(backgrounds[ax])
+        for a in artists:
+            ax.draw_artist(a)
+        canvas.blit(ax.bbox)
+
+
+def show_info():
+    """Blit the metrics text, if it changed; this alone costs about a frame."""
+    if not backgrounds or text_info.get_text() == info:
+        return
+    text_info.set_text(info)
+    fig.canvas.restore_region(backgrounds[ax_info])
+    ax_info.draw_artist(text_info)
+    fig.canvas.blit(ax_info.bbox)
+
+
+def on_slider(s):
+    recompute()
+    if not backgrounds:
+        return
+    canvas = fig.canvas
+    canvas.restore_region(backgrounds[s])
+    draw_slider(s)
+    canvas.blit(slider_strip(s))
+    blit_plots()
+
+
+def on_check(label):
+    recompute()
+    if label == 'Show run':
+        for line in run_lines:
+            line.set_visible(not line.get_visible())
+        fig.canvas.draw_idle()  # the run is part of the static background
+    elif backgrounds:
+        blit_plots()
+        show_info()
+
+
+def check_frames(n_values=30):
+    """Time whole slider frames (set_val through the last blit) off-screen.
+
+    Each slider is swept across its range from the initial state, so almost
+    every frame misses the cache. The metrics refresh that follows a drag is timed
+    separately.
+    """
+    fig.canvas.draw()
+    frames, refreshes = [], []
+    for s in sliders.values():
+        for val in np.linspace(s.valmin, s.valmax, n_values):
+            t0 = time.perf_counter()
+            s.set_val(val)
+            frames.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        show_info()
+        refreshes.append(time.perf_counter() - t0)
+        s.reset()
+    limits = 'on' if check.get_status()[0] else 'off'
+    print(f"[INFO] slider frames (PWM limits {limits}): median {np.median(frames) * 1e3:.2f} ms, "
+          f"slowest {max(frames) * 1e3:.2f} ms; metrics refresh {np.median(refreshes) * 1e3:.2f} ms")
+
+
+for s in sliders.values():
+    s.on_changed(lambda val, s=s: on_slider(s))
+check.on_clicked(on_check)
+fig.canvas.mpl_connect('draw_event', on_draw)
+fig.canvas.mpl_connect('button_release_event', lambda event: show_info())
+
+recompute()
+if CHECK:
+    check_fast_path()
+    check_frames()
+else:
+    plt.show()